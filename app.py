@@ -1,34 +1,254 @@
 # app.py -- Polished UI version (Streamlit)
 import streamlit as st
 import pandas as pd
-from sqlalchemy import create_engine, text
+import numpy as np
+from sqlalchemy import bindparam, create_engine, event, text
+from sqlalchemy.pool import QueuePool
 from datetime import date
 import matplotlib.pyplot as plt
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import io
+import itertools
 
 # -------------------------
 # Setup & DB ensure-table
 # -------------------------
 st.set_page_config(page_title="Expense Tracker", page_icon="💰", layout="wide")
-engine = create_engine("sqlite:///expenses.db")
-
-# Ensure table exists
-with engine.connect() as conn:
-    conn.execute(text("""
-        CREATE TABLE IF NOT EXISTS expenses (
-            date TEXT,
-            category TEXT,
-            amount REAL,
-            note TEXT
-        )
-    """))
-    conn.commit()
+
+# One engine per server process (not per rerun). Connections are pooled and
+# the PRAGMAs are applied once when each pooled connection is opened.
+@st.cache_resource
+def get_engine():
+    eng = create_engine(
+        "sqlite:///expenses.db",
+        connect_args={"check_same_thread": False},
+        poolclass=QueuePool,
+        pool_size=4,
+    )
+
+    @event.listens_for(eng, "connect")
+    def _sqlite_pragmas(dbapi_conn, _record):
+        cur = dbapi_conn.cursor()
+        cur.execute("PRAGMA journal_mode=WAL")
+        cur.execute("PRAGMA synchronous=NORMAL")
+        cur.execute("PRAGMA temp_store=MEMORY")
+        cur.execute("PRAGMA cache_size=-64000")
+        cur.close()
+
+    # Ensure table exists
+    with eng.connect() as conn:
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS expenses (
+                date TEXT,
+                category TEXT,
+                amount REAL,
+                note TEXT
+            )
+        """))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_expenses_date ON expenses(date)"))
+        # (category, date) serves category (+ month range) filters; scanned backwards
+        # it yields ORDER BY date DESC, rowid DESC without a sort
+        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_expenses_cat_date ON expenses(category, date)"))
+        conn.commit()
+    return eng
+
+engine = get_engine()
+
+# Cached fetch. The token (max rowid, row count) is cheap to query and changes
+# whenever rows are added or removed, so reruns that don't touch the data or
+# the filters reuse the cached DataFrame instead of re-reading the table.
+def data_token():
+    with engine.connect() as conn:
+        return tuple(conn.execute(text("SELECT COALESCE(MAX(rowid), 0), COUNT(*) FROM expenses")).one())
+
+def filter_where(month, cat, q):
+    """Build a parameterized WHERE clause for the month/category/search filters."""
+    clauses, params = [], {}
+    if month and month != "All":
+        # Half-open range [month start, next month start) so the date indexes apply
+        year, mon = map(int, month.split("-"))
+        next_year, next_mon = (year + 1, 1) if mon == 12 else (year, mon + 1)
+        clauses.append("date >= :m0 AND date < :m1")
+        params["m0"] = f"{year:04d}-{mon:02d}-01"
+        params["m1"] = f"{next_year:04d}-{next_mon:02d}-01"
+    if cat and cat != "All":
+        clauses.append("category = :c")
+        params["c"] = cat
+    if q:
+        # LIKE is case-insensitive for ASCII; escape wildcards so q matches literally
+        clauses.append("(note LIKE :q ESCAPE '\\' OR category LIKE :q ESCAPE '\\')")
+        escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        params["q"] = f"%{escaped}%"
+    where = ("WHERE " + " AND ".join(clauses)) if clauses else ""
+    return where, params
+
+CATEGORIES = ["Food", "Transport", "Shopping", "Bills", "Entertainment", "Other"]
+
+# Rows per multi-row INSERT; 4 params each keeps us under SQLite's
+# historical 999 bound-variable limit.
+INSERT_CHUNK = 200
+
+def insert_expenses(rows):
+    """Insert (date, category, amount, note) rows in a single transaction.
+
+    Rows are written with multi-row ``VALUES (?,?,?,?), (?,?,?,?), ...``
+    statements, INSERT_CHUNK rows at a time.
+    """
+    rows = [(str(d), c, float(a), n) for d, c, a, n in rows]
+    if not rows:
+        return
+    with engine.begin() as conn:
+        for start in range(0, len(rows), INSERT_CHUNK):
+            chunk = rows[start:start + INSERT_CHUNK]
+            placeholders = ", ".join(["(?, ?, ?, ?)"] * len(chunk))
+            conn.exec_driver_sql(
+                f"INSERT INTO expenses (date, category, amount, note) VALUES {placeholders}",
+                tuple(itertools.chain.from_iterable(chunk)),
+            )
+    st.cache_data.clear()
+
+def _import_date(value):
+    # Parsed one value at a time so mixed formats (and mixed UTC offsets) in a
+    # single file don't fail together; the date is kept as written, not shifted
+    ts = pd.to_datetime(value, errors="coerce")
+    return None if pd.isna(ts) else ts.strftime("%Y-%m-%d")
+
+def read_import_csv(file):
+    """Parse an uploaded CSV into insertable rows, applying the form's checks.
+
+    Returns ``(rows, skipped)``. Raises ValueError with a readable message if
+    the file can't be parsed or lacks one of the expected columns.
+    """
+    dtype = {"date": str, "category": str, "note": str}
+    try:
+        df = pd.read_csv(file, dtype=dtype)
+    except UnicodeDecodeError:
+        # Excel and older tools often export Latin-1 rather than UTF-8
+        file.seek(0)
+        df = pd.read_csv(file, dtype=dtype, encoding="latin-1")
+    missing = {"date", "category", "amount", "note"} - set(df.columns)
+    if missing:
+        raise ValueError(f"missing column(s): {', '.join(sorted(missing))}")
+    n_total = len(df)
+    # Same rules as the form: a real date, a known category and a positive amount
+    df["date"] = df["date"].map(_import_date)
+    df["amount"] = pd.to_numeric(df["amount"], errors="coerce")
+    df = df[df["date"].notna() & df["category"].isin(CATEGORIES) & np.isfinite(df["amount"]) & (df["amount"] > 0)]
+    df = df.astype(object).where(df.notna(), None)
+    rows = list(df[["date", "category", "amount", "note"]].itertuples(index=False, name=None))
+    return rows, n_total - len(rows)
+
+PAGE_SIZE = 200
+# rowid breaks ties between same-day rows so page boundaries are stable
+NEWEST_FIRST = "ORDER BY date DESC, rowid DESC"
+
+# Cached readers below are keyed on the filters, including free-text search,
+# so each one keeps a bounded number of entries.
+@st.cache_data(show_spinner=False, max_entries=64)
+def load_expenses(token, month="All", cat="All", q="", page=1):
+    """One PAGE_SIZE page of the filtered rows, newest first."""
+    where, params = filter_where(month, cat, q)
+    sql = f"SELECT rowid, * FROM expenses {where} {NEWEST_FIRST} LIMIT :lim OFFSET :off"
+    params.update(lim=PAGE_SIZE, off=(page - 1) * PAGE_SIZE)
+    # Parse dates once here; the cached frame carries a datetime64 column
+    df = pd.read_sql(
+        text(sql),
+        con=engine,
+        params=params,
+        parse_dates={"date": {"errors": "coerce"}},
+    )
+    # Dictionary-encode category; keep any non-standard values as extra categories
+    extra = sorted(set(df["category"].dropna()) - set(CATEGORIES))
+    df["category"] = df["category"].astype(pd.CategoricalDtype(CATEGORIES + extra))
+    return df
+
+DELETE_IDS_SQL = text("DELETE FROM expenses WHERE rowid IN :ids").bindparams(bindparam("ids", expanding=True))
+
+def delete_expenses(ids=None):
+    """Delete the given rowids (or every row when ids is None) in one transaction."""
+    with engine.begin() as conn:
+        if ids is None:
+            conn.execute(text("DELETE FROM expenses"))
+        else:
+            conn.execute(DELETE_IDS_SQL, {"ids": [int(i) for i in ids]})
+    st.cache_data.clear()
+
+def csv_bytes(df):
+    """Encode df as UTF-8 CSV with pyarrow's writer, straight into a bytes buffer."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # Plain column types for the CSV writer: decode categoricals, write dates without a time
+    for i, field in enumerate(table.schema):
+        if pa.types.is_dictionary(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(field.type.value_type))
+        elif pa.types.is_timestamp(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.date32(), safe=False))
+    buf = io.BytesIO()
+    pacsv.write_csv(table, buf)
+    return buf.getvalue()
+
+def parquet_bytes(df):
+    """Encode df as Snappy-compressed Parquet (smaller than CSV for backups)."""
+    buf = io.BytesIO()
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), buf, compression="snappy")
+    return buf.getvalue()
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def filtered_csv(token, month="All", cat="All", q=""):
+    """CSV bytes for every filtered row (all pages), read directly rather than via the page cache."""
+    where, params = filter_where(month, cat, q)
+    df = pd.read_sql(text(f"SELECT rowid, * FROM expenses {where} {NEWEST_FIRST}"), con=engine, params=params)
+    return csv_bytes(df)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def load_summary(token, month="All", cat="All", q=""):
+    """Total, transaction count and top category for the filtered rows, in one query."""
+    where, params = filter_where(month, cat, q)
+    sql = f"""
+        SELECT COALESCE(SUM(amount), 0), COUNT(*),
+               (SELECT category FROM expenses {where}
+                GROUP BY category ORDER BY SUM(amount) DESC LIMIT 1)
+        FROM expenses {where}
+    """
+    with engine.connect() as conn:
+        return tuple(conn.execute(text(sql), params).one())
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def load_category_totals(token, month="All", cat="All", q=""):
+    """(category, total) pairs for the filtered rows, largest first."""
+    where, params = filter_where(month, cat, q)
+    sql = f"SELECT category, SUM(amount) FROM expenses {where} GROUP BY category ORDER BY 2 DESC"
+    with engine.connect() as conn:
+        return tuple((str(c), float(v)) for c, v in conn.execute(text(sql), params))
+
+@st.cache_data(show_spinner=False)
+def filter_options(token):
+    with engine.connect() as conn:
+        months = conn.execute(text("SELECT DISTINCT substr(date, 1, 7) FROM expenses ORDER BY 1 DESC")).scalars().all()
+        cats = conn.execute(text("SELECT DISTINCT category FROM expenses ORDER BY 1")).scalars().all()
+    return months, cats
+
+# Rendered figure is cached as PNG bytes keyed on the (category, total) pairs,
+# so reruns with unchanged totals skip Matplotlib entirely.
+@st.cache_data(show_spinner=False, max_entries=32)
+def pie_png(items: tuple) -> bytes:
+    labels, values = zip(*items)
+    fig, ax = plt.subplots(figsize=(6, 4))
+    ax.pie(values, labels=labels, autopct="%1.1f%%", startangle=90, wedgeprops={"edgecolor":"w"})
+    ax.axis("equal")
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", bbox_inches="tight")
+    plt.close(fig)
+    return buf.getvalue()
 
 # -------------------------
 # Styles (simple CSS)
 # -------------------------
-# We inject a bit of CSS to polish visuals and support dark/light
-def inject_css(dark_mode: bool):
+# We inject a bit of CSS to polish visuals and support dark/light.
+# The stylesheet only depends on the theme, so each variant is built once.
+@st.cache_data(show_spinner=False)
+def build_css(dark_mode: bool) -> str:
     if dark_mode:
         bg = "#0e1117"
         card = "#0f1720"
@@ -40,42 +260,42 @@ def inject_css(dark_mode: bool):
         text = "#0b1b2b"
         muted = "#5b6b75"
 
-    st.markdown(
-        f"""
-        <style>
-        /* Page background */
-        .stApp {{
-            background-color: {bg};
-            color: {text};
-        }}
-        /* Card like containers */
-        .card {{
-            background: {card};
-            padding: 14px;
-            border-radius: 10px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.06);
-            color: {text};
-        }}
-        .muted {{ color: {muted}; font-size:13px; }}
-        .header-title {{
-            font-size:34px;
-            font-weight:700;
-            margin-bottom: 0px;
-        }}
-        .header-sub {{
-            color: {muted};
-            margin-top: 2px;
-            margin-bottom: 6px;
-        }}
-        .small-note {{ font-size:13px; color:{muted}; }}
-        /* table tweaks */
-        .stDataFrame th {{
-            background-color: transparent !important;
-        }}
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    return f"""
+    <style>
+    /* Page background */
+    .stApp {{
+        background-color: {bg};
+        color: {text};
+    }}
+    /* Card like containers */
+    .card {{
+        background: {card};
+        padding: 14px;
+        border-radius: 10px;
+        box-shadow: 0 2px 8px rgba(0,0,0,0.06);
+        color: {text};
+    }}
+    .muted {{ color: {muted}; font-size:13px; }}
+    .header-title {{
+        font-size:34px;
+        font-weight:700;
+        margin-bottom: 0px;
+    }}
+    .header-sub {{
+        color: {muted};
+        margin-top: 2px;
+        margin-bottom: 6px;
+    }}
+    .small-note {{ font-size:13px; color:{muted}; }}
+    /* table tweaks */
+    .stDataFrame th {{
+        background-color: transparent !important;
+    }}
+    </style>
+    """
+
+def inject_css(dark_mode: bool):
+    st.markdown(build_css(dark_mode), unsafe_allow_html=True)
 
 # -------------------------
 # Sidebar controls
@@ -87,22 +307,34 @@ inject_css(dark)
 st.sidebar.markdown("**Quick actions**")
 if st.sidebar.button("Add sample expense"):
     # add a tiny sample to let user preview UI easily
-    df_sample = pd.DataFrame([{
-        "date": date.today(),
-        "category": "Food",
-        "amount": 199.0,
-        "note": "Sample lunch"
-    }])
-    df_sample.to_sql("expenses", con=engine, if_exists="append", index=False)
+    insert_expenses([(date.today(), "Food", 199.0, "Sample lunch")])
     st.sidebar.success("Added sample expense")
 
 st.sidebar.markdown("---")
 st.sidebar.markdown("**Export / Backup**")
-if st.sidebar.button("Download DB (CSV)"):
+backup_format = st.sidebar.radio("Backup format", ["CSV", "Parquet"], horizontal=True)
+if st.sidebar.button(f"Download DB ({backup_format})"):
     df_all = pd.read_sql("SELECT * FROM expenses", con=engine)
-    buff = io.StringIO()
-    df_all.to_csv(buff, index=False)
-    st.download_button("Download CSV", buff.getvalue(), file_name="expenses_backup.csv", mime="text/csv")
+    if backup_format == "Parquet":
+        st.download_button("Download Parquet", parquet_bytes(df_all), file_name="expenses_backup.parquet", mime="application/octet-stream")
+    else:
+        st.download_button("Download CSV", csv_bytes(df_all), file_name="expenses_backup.csv", mime="text/csv")
+
+st.sidebar.markdown("**Import**")
+# Keyed uploader: bumping the key after an import clears the file, so a second
+# click can't insert the same rows again
+import_key = st.session_state.setdefault("import_key", 0)
+uploaded = st.sidebar.file_uploader("Import CSV (date, category, amount, note)", type="csv", key=f"import-{import_key}")
+if uploaded is not None and st.sidebar.button("Import rows"):
+    try:
+        rows, skipped = read_import_csv(uploaded)
+    except ValueError as exc:  # also covers pandas' EmptyDataError / ParserError
+        st.sidebar.error(f"Could not import CSV: {exc}")
+    else:
+        insert_expenses(rows)
+        st.session_state["import_key"] = import_key + 1
+        msg = f"Imported {len(rows)} rows"
+        st.sidebar.success(msg + (f" (skipped {skipped} with an invalid date, category or amount)" if skipped else ""))
 
 st.sidebar.markdown("---")
 st.sidebar.caption("Polished UI demo • Your data stays in SQLite (expenses.db)")
@@ -110,8 +342,7 @@ st.sidebar.caption("Polished UI demo • Your data stays in SQLite (expenses.db)
 # -------------------------
 # Header (centered)
 # -------------------------
-st.markdown(
-    """
+HEADER_HTML = """
     <div style='display:flex;align-items:center;justify-content:space-between;'>
       <div>
         <div class="header-title">💰 Expense & Budget Tracker</div>
@@ -121,9 +352,8 @@ st.markdown(
         <div class="small-note">Logged in: Local</div>
       </div>
     </div>
-    """,
-    unsafe_allow_html=True,
-)
+"""
+st.markdown(HEADER_HTML, unsafe_allow_html=True)
 
 st.markdown("")  # spacer
 
@@ -138,7 +368,7 @@ with st.container():
         with c1:
             expense_date = st.date_input("Date", value=date.today())
         with c2:
-            category = st.selectbox("Category", ["Food", "Transport", "Shopping", "Bills", "Entertainment", "Other"])
+            category = st.selectbox("Category", CATEGORIES)
         with c3:
             amount = st.number_input("Amount (₹)", min_value=0.0, format="%.2f")
         note = st.text_input("Note (optional)")
@@ -147,13 +377,7 @@ with st.container():
             if amount <= 0:
                 st.warning("Amount must be positive.")
             else:
-                new_entry = pd.DataFrame({
-                    "date": [expense_date],
-                    "category": [category],
-                    "amount": [amount],
-                    "note": [note]
-                })
-                new_entry.to_sql("expenses", con=engine, if_exists="append", index=False)
+                insert_expenses([(expense_date, category, amount, note)])
                 st.success(f"Added {category} — ₹{amount:.2f}")
     st.markdown("</div>", unsafe_allow_html=True)
 
@@ -162,9 +386,8 @@ st.markdown("")  # spacer
 # -------------------------
 # Fetch & Filters
 # -------------------------
-df = pd.read_sql("SELECT rowid, * FROM expenses", con=engine)
-if df is None:
-    df = pd.DataFrame(columns=["rowid", "date", "category", "amount", "note"])
+token = data_token()
+months, categories = filter_options(token)
 
 # Filter UI
 with st.container():
@@ -172,24 +395,16 @@ with st.container():
     st.subheader("Filters & Quick Search")
     f1, f2, f3 = st.columns([1.5, 1.5, 1])
     with f1:
-        months = df["date"].astype(str).apply(lambda x: x[:7]).sort_values(ascending=False).unique() if not df.empty else []
         selected_month = st.selectbox("Month", options=["All"] + list(months), index=0)
     with f2:
-        cat_options = ["All"] + sorted(df["category"].unique().tolist()) if not df.empty else ["All"]
-        selected_cat = st.selectbox("Category", options=cat_options, index=0)
+        selected_cat = st.selectbox("Category", options=["All"] + list(categories), index=0)
     with f3:
         q = st.text_input("Search notes / category")
     st.markdown("</div>", unsafe_allow_html=True)
 
-# Apply filters
-df_filtered = df.copy()
-if not df.empty:
-    if selected_month and selected_month != "All":
-        df_filtered = df_filtered[df_filtered["date"].astype(str).str.startswith(selected_month)]
-    if selected_cat and selected_cat != "All":
-        df_filtered = df_filtered[df_filtered["category"] == selected_cat]
-    if q:
-        df_filtered = df_filtered[df_filtered["note"].str.contains(q, case=False, na=False) | df_filtered["category"].str.contains(q, case=False, na=False)]
+# Filters are applied in SQL; metrics and chart are aggregated there too, so
+# the table only materializes the visible page of rows
+total, transactions, top_cat = load_summary(token, selected_month, selected_cat, q)
 
 # -------------------------
 # Dashboard Metrics + Table
@@ -198,27 +413,27 @@ with st.container():
     st.markdown('<div class="card">', unsafe_allow_html=True)
     st.subheader("Overview")
 
-    if df_filtered.empty:
+    if transactions == 0:
         st.info("No expenses to show. Add your first expense above.")
     else:
-        total = df_filtered["amount"].sum()
-        transactions = len(df_filtered)
-        try:
-            top_cat = df_filtered.groupby("category")["amount"].sum().idxmax()
-        except Exception:
-            top_cat = "—"
-
         m1, m2, m3 = st.columns(3)
         m1.metric("Total Spent (₹)", f"{total:,.2f}")
         m2.metric("Transactions", f"{transactions}")
-        m3.metric("Top Category", top_cat)
+        m3.metric("Top Category", top_cat or "—")
 
         st.markdown("**Transactions**")
+        n_pages = -(-transactions // PAGE_SIZE)
+        page = st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages, value=1, step=1) if n_pages > 1 else 1
+        df_page = load_expenses(token, selected_month, selected_cat, q, page=int(page))
         # show dataframe but limit width for readability
-        st.dataframe(df_filtered.sort_values(by="date", ascending=False).reset_index(drop=True), use_container_width=True)
+        st.dataframe(
+            df_page,
+            use_container_width=True,
+            column_config={"date": st.column_config.DateColumn("date", format="YYYY-MM-DD")},
+        )
 
-        # Download CSV for filtered data
-        csv = df_filtered.to_csv(index=False).encode("utf-8")
+        # Download CSV for filtered data (all pages)
+        csv = filtered_csv(token, selected_month, selected_cat, q)
         st.download_button("📥 Download filtered CSV", data=csv, file_name="expenses_filtered.csv", mime="text/csv")
 
     st.markdown("</div>", unsafe_allow_html=True)
@@ -229,14 +444,10 @@ with st.container():
 with st.container():
     st.markdown('<div class="card">', unsafe_allow_html=True)
     st.subheader("📊 Spending Breakdown")
-    if df_filtered.empty:
+    if transactions == 0:
         st.write("No data to plot.")
     else:
-        category_totals = df_filtered.groupby("category")["amount"].sum().sort_values(ascending=False)
-        fig, ax = plt.subplots(figsize=(6, 4))
-        ax.pie(category_totals, labels=category_totals.index, autopct="%1.1f%%", startangle=90, wedgeprops={"edgecolor":"w"})
-        ax.axis("equal")
-        st.pyplot(fig)
+        st.image(pie_png(load_category_totals(token, selected_month, selected_cat, q)))
     st.markdown("</div>", unsafe_allow_html=True)
 
 # -------------------------
@@ -248,28 +459,33 @@ with st.container():
 
     col_a, col_b = st.columns([2, 3])
     with col_a:
+        # Result of a delete from the previous run (shown after st.rerun)
+        flash = st.session_state.pop("delete_flash", None)
+        if flash:
+            level, msg = flash
+            getattr(st, level)(msg)
         delete_mode = st.radio("Delete mode:", ["By ID", "Select multiple", "Delete all"], horizontal=False)
         if delete_mode == "By ID":
             del_id = st.number_input("Enter ID (rowid) to delete:", min_value=1, step=1)
             if st.button("Delete by ID"):
-                with engine.begin() as conn:
-                    conn.execute(text("DELETE FROM expenses WHERE rowid = :rid"), {"rid": del_id})
-                st.success(f"Deleted ID {del_id}. Refresh to update.")
+                delete_expenses([del_id])
+                st.session_state["delete_flash"] = ("success", f"Deleted ID {del_id}.")
+                st.rerun()
         elif delete_mode == "Select multiple":
-            options = df_filtered["rowid"].tolist() if not df_filtered.empty else []
+            options = df_page["rowid"].tolist() if transactions else []
             sel = st.multiselect("Select IDs to delete:", options)
             if st.button("Delete selected"):
                 if sel:
-                    with engine.begin() as conn:
-                        conn.execute(text(f"DELETE FROM expenses WHERE rowid IN ({','.join(map(str, sel))})"))
-                    st.success(f"Deleted {len(sel)} records. Refresh to update.")
+                    delete_expenses(sel)
+                    st.session_state["delete_flash"] = ("success", f"Deleted {len(sel)} records.")
+                    st.rerun()
                 else:
                     st.warning("No selection.")
         else:
             if st.button("⚠️ Delete all expenses"):
-                with engine.begin() as conn:
-                    conn.execute(text("DELETE FROM expenses"))
-                st.warning("All records deleted. Refresh to update.")
+                delete_expenses()
+                st.session_state["delete_flash"] = ("warning", "All records deleted.")
+                st.rerun()
 
     with col_b:
         st.markdown("**Quick tips**")